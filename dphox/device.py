@@ -1,22 +1,23 @@
 import datetime
 import hashlib
 from collections import defaultdict
-from copy import deepcopy, deepcopy as copy
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import BinaryIO
 
 import numpy as np
 
 from shapely.geometry import MultiPolygon, Polygon
-from shapely.ops import unary_union
 import networkx as nx
 
 from .foundry import CommonLayer, FABLESS, Foundry
 
 from .geometry import Geometry
 from .pattern import Box, Pattern, Port
-from .transform import GDSTransform, rotate2d
-from .typing import Dict, Float2, Int2, List, Optional, Tuple, Union
+from .port import transform_ports
+from .transform import AffineTransform, GDSTransform, rotate2d, translate2d
+from .typing import Dict, Float2, Int2, LayerLabel, List, Optional, Tuple, Union
 from .utils import fix_dataclass_init_docs, min_aspect_bounds, poly_bounds, poly_points, PORT_GDS_LABEL, PORT_LAYER, \
     shapely_patch
 
@@ -60,11 +61,11 @@ class Device:
 
     def __init__(self, name: str, devices: List[Union[Tuple[Pattern, Union[int, str]], "Device"]] = None):
         self.name = name
-        self.pattern_to_layer = [] if devices is None else devices
-        self.pattern_to_layer = sum(
-            [p.pattern_to_layer if isinstance(p, Device) else [p] for p in self.pattern_to_layer], []
-        )
-        self.layer_to_polys = self._update_layers()
+        self.pattern_to_layer = [
+            pl for p in ([] if devices is None else devices)
+            for pl in (p.pattern_to_layer if isinstance(p, Device) else [p])
+        ]
+        self._layers_dirty = True  # layer_to_polys is regrouped lazily whenever the patterns change
         self.child_to_device: Dict[str, Device] = {}  # children in this dictionary
         self.child_to_transform: Dict[str, GDSTransform] = {}  # dictionary from child name to transform
 
@@ -82,6 +83,32 @@ class Device:
             layer_to_polys[layer].extend(pattern.geoms)
         return layer_to_polys
 
+    def _layers_stale(self) -> bool:
+        # transforms mark the layers dirty, while a replaced or resized pattern_to_layer list is detected here
+        return self._layers_dirty or self._layers_source is not self.pattern_to_layer \
+            or self._layers_count != len(self.pattern_to_layer)
+
+    @property
+    def layer_to_polys(self) -> Dict[Union[int, str], List[np.ndarray]]:
+        """Map from each layer to the list of polygons in that layer.
+
+        Note:
+            The polygons are only regrouped when this is accessed after the patterns in the device have changed
+            (transformed, or added to or removed from :code:`pattern_to_layer`), so chains of transforms
+            (e.g. :code:`rotate(...).translate(...)`) do not rebuild the map at every step.
+
+        Returns:
+            The layer to polygon dictionary.
+
+        """
+        if self._layers_stale():
+            self._layer_to_polys = self._update_layers()
+            self._layer_to_pattern = None
+            self._layers_source, self._layers_count = self.pattern_to_layer, len(self.pattern_to_layer)
+            self._layers_dirty = False
+        self._owned_layers = set()  # every list returned here may now be held by the caller
+        return self._layer_to_polys
+
     def merge_patterns(self):
         self.pattern_to_layer = [(Pattern(*self.layer_to_polys[layer]), layer) for layer in self.layer_to_polys]
         return self
@@ -128,22 +155,29 @@ class Device:
                         # TODO(sunil): actually extract the pins from this layer.
                         continue
                     # fixing point definitions from mask to 1nm precision,
-                    # kinda hacky but is physical and prevents false polygons
-                    multilayers[polygon.layer].append(Pattern(Polygon(np.around(points, decimals=3))))
-        return cls(cell.name, [(Pattern(*pattern_list), layer) for layer, pattern_list in multilayers.items()])
+                    # kinda hacky but is physical and prevents false polygons.
+                    # the raw 2 x N point array is grouped directly (no per-polygon Pattern/Polygon wrapper),
+                    # so the ring is closed here as it would be for a shapely polygon exterior.
+                    points = np.around(points, decimals=3)
+                    if not np.array_equal(points[0], points[-1]):
+                        points = np.vstack((points, points[:1]))
+                    multilayers[polygon.layer].append(points.T)
+        return cls(cell.name, [(Pattern(*polys), layer) for layer, polys in multilayers.items()])
 
     @property
     def bounds(self) -> np.ndarray:
         """Bounding box of the form :code:`(minx, miny, maxx, maxy)`
 
+        Note:
+            The bounds are computed from the current pattern geometries (which may be shared with other devices)
+            in a single vectorized pass over all polygon points.
+
         Returns:
             Bounding box ndarray.
 
         """
-        bound_list = []
-        for p, _ in self.pattern_to_layer:
-            bound_list.append(np.reshape(p.bounds, (2, 2)).T)
-        bound_list = np.hstack(bound_list) if bound_list else np.array([[], []])
+        polys = [poly for pattern, _ in self.pattern_to_layer for poly in pattern.geoms if poly.size > 0]
+        bound_list = np.reshape(poly_bounds(polys, overall=True), (2, 2)).T if polys else np.array([[], []])
         child_bboxes = []
         for child_name, child in self.child_to_device.items():
             child_bboxes.extend(self.child_to_transform[child_name][0].transform_points(child.bbox))
@@ -155,9 +189,25 @@ class Device:
         else:
             return np.array((0, 0, 0, 0))
 
+    def _cached_layer_to_pattern(self) -> Dict[Union[int, str], Pattern]:
+        layer_to_polys = self.layer_to_polys
+        if self._layer_to_pattern is None:
+            self._layer_to_pattern = {layer: Pattern(p) for layer, p in layer_to_polys.items()}
+        return self._layer_to_pattern
+
     @property
-    def layer_to_pattern(self):
-        return {layer: Pattern(p) for layer, p in self.layer_to_polys.items()}
+    def layer_to_pattern(self) -> Dict[Union[int, str], Pattern]:
+        """Map from each layer to a :code:`Pattern` of all polygons in that layer.
+
+        Note:
+            Like :code:`layer_to_polys`, the per-layer patterns are only rebuilt after the patterns in the device
+            have changed. Copies are returned so that modifying them does not affect the device.
+
+        Returns:
+            The layer to pattern dictionary.
+
+        """
+        return {layer: p.copy for layer, p in self._cached_layer_to_pattern().items()}
 
     @property
     def full_layer_to_pattern(self):
@@ -179,7 +229,7 @@ class Device:
 
     def __hash__(self):
         return hashlib.sha256({self.name: {
-            layer: p.__hash__() for layer, p in self.layer_to_pattern
+            layer: p.__hash__() for layer, p in self._cached_layer_to_pattern()
         },
             f'{self.name}_children': {
                 name: child.__hash__() + hashlib.sha256(self.child_to_transform[name][0])
@@ -296,16 +346,7 @@ class Device:
             The translated device.
 
         """
-        if self.child_to_device:
-            raise NotImplementedError("We do not yet support transforming cells with children."
-                                      "This should in principle not be required though: you can place this cell"
-                                      "in a parent cell, i.e. dp.Device('transformed').place(device, transform).")
-        for pattern, _ in self.pattern_to_layer:
-            pattern.translate(dx, dy)
-        self.layer_to_polys = self._update_layers()
-        for name, port in self.port.items():
-            self.port[name] = Port(port.x + dx, port.y + dy, port.a, port.w)
-        return self
+        return self.transform(translate2d((dx, dy)))
 
     def rotate(self, angle: float, origin: Float2 = (0, 0)) -> "Device":
         """Rotate the device by rotating all the patterns within it.
@@ -318,15 +359,8 @@ class Device:
             The rotated device.
 
         """
-        if self.child_to_device:
-            raise NotImplementedError("We do not yet support transforming cells with children."
-                                      "This should in principle not be required though: you can place this cell"
-                                      "in a parent cell, i.e. dp.Device('transformed').place(device, transform).")
         if angle % 360 != 0:  # to save time, only rotate if the angle is nonzero
-            for pattern, _ in self.pattern_to_layer:
-                pattern.rotate(angle, origin)
-            self.layer_to_polys = self._update_layers()
-            self.port = {name: port.rotate(angle, origin) for name, port in self.port.items()}
+            self.transform(rotate2d(np.radians(angle), origin))
         return self
 
     def reflect(self, center: Float2 = (0, 0), horiz: bool = False) -> "Device":
@@ -346,12 +380,40 @@ class Device:
                                       "in a parent cell, i.e. dp.Device('transformed').place(device, transform).")
         for pattern, _ in self.pattern_to_layer:
             pattern.reflect(center, horiz)
-        self.layer_to_polys = self._update_layers()
+        self._layers_dirty = True
+        return self
+
+    def transform(self, transform: Union[AffineTransform, np.ndarray]) -> "Device":
+        """Apply an affine transform to all the patterns and ports within the device in a single pass.
+
+        Args:
+            transform: The :code:`3x3` affine transform (or :code:`AffineTransform`) to apply.
+
+        Returns:
+            The transformed device.
+
+        """
+        if self.child_to_device:
+            raise NotImplementedError("We do not yet support transforming cells with children."
+                                      "This should in principle not be required though: you can place this cell"
+                                      "in a parent cell, i.e. dp.Device('transformed').place(device, transform).")
+        transformer = transform if isinstance(transform, AffineTransform) else AffineTransform(transform)
+        # device ports may be shared with the ports of its patterns, which are transformed along with the pattern.
+        pattern_port_ids = {id(port) for pattern, _ in self.pattern_to_layer for port in pattern.port.values()}
+        for pattern, _ in self.pattern_to_layer:
+            pattern.transform(transformer)
+        self._layers_dirty = True
+        transform_ports([port for port in self.port.values() if id(port) not in pattern_port_ids],
+                        transformer.transform)
         return self
 
     def to(self, port: Port, from_port: Optional[str] = None):
         """Lego-connect this device's :code:`from_port` (origin if not specified) to another device's port.
 
+        Note:
+            The rotation and translation are composed into a single affine transform, so the patterns are
+            only traversed once.
+
         Args:
             port: The port to which the device should be connected.
             from_port: The port name corresponding to this device's port that should be connected to :code:`port`.
@@ -361,11 +423,13 @@ class Device:
 
         """
         if from_port is None:
-            return self.rotate(port.a).translate(port.x, port.y)
+            angle, origin, shift = port.a, (0, 0), (port.x, port.y)
         else:
-            return self.rotate(port.a - self.port[from_port].a + 180, origin=self.port[from_port].xy).translate(
-                port.x - self.port[from_port].x, port.y - self.port[from_port].y
-            )
+            fp = self.port[from_port]
+            angle, origin, shift = port.a - fp.a + 180, fp.xy, (port.x - fp.x, port.y - fp.y)
+        if angle % 360 == 0 and shift[0] == 0 and shift[1] == 0:
+            return self  # already in place, so skip the transform
+        return self.transform(AffineTransform([rotate2d(np.radians(angle), origin), translate2d(shift)]))
 
     def place(self, device: "Device", placement: Union[GDSTransformOrTuple],
               from_port: Optional[Union[str, Port, tuple]] = None, flip_y: bool = False, return_ports: bool = False):
@@ -438,11 +502,16 @@ class Device:
     def copy(self) -> "Device":
         """Return a copy of this device for repeated use.
 
+        Note:
+            Child devices are shared by reference rather than copied, since they are cells that are
+            referenced by name (as in GDS) and are never transformed in place by the parent device.
+
         Returns:
-            A deep copy of this device.
+            A copy of this device (child devices are shared).
 
         """
-        return copy(self)
+        memo = {id(child): child for child in self.child_to_device.values()}
+        return deepcopy(self, memo)
 
     @property
     def gdspy_cell(self, foundry: Foundry = FABLESS):
@@ -457,20 +526,19 @@ class Device:
         """
         import gdspy as gy
         cell = gy.Cell(self.name)
-        for pattern, layer in self.pattern_to_layer:
-            for poly in self.layer_to_polys[layer]:
-                cell.add(
-                    gy.Polygon(poly,
-                               layer=foundry.layer_to_gds_label[layer][0],
-                               datatype=foundry.layer_to_gds_label[layer][1])
-                )
+        layer_to_gds_label = foundry.layer_to_gds_label
+        for layer, polys in self.layer_to_polys.items():
+            gds_layer, datatype = layer_to_gds_label[layer]
+            for poly in polys:
+                cell.add(gy.Polygon(np.ascontiguousarray(poly.T), layer=gds_layer, datatype=datatype))
         return cell
 
-    def nazca_cell(self, foundry: Foundry = FABLESS) -> "nd.Cell":
+    def nazca_cell(self, foundry: Foundry = FABLESS, layers: Optional[List[LayerLabel]] = None) -> "nd.Cell":
         """Turn this multilayer into a nazca cell (need to install nazca for this to work).
 
         Args:
-            Foundry for creating the nazca cell (provide the layer map).
+            foundry: Foundry for creating the nazca cell (provide the layer map).
+            layers: Only include polygons in these layers (include all layers if :code:`None`).
 
         Returns:
             A Nazca cell.
@@ -478,11 +546,14 @@ class Device:
         """
         if not NAZCA_IMPORTED:
             raise ImportError('Nazca not installed! Please install nazca prior to running nazca_cell().')
+        layer_to_gds_label = foundry.layer_to_gds_label
         with nd.Cell(self.name) as cell:
-            for pattern, layer in self.pattern_to_layer:
-                for poly in pattern.geoms:
-                    nd.Polygon(points=poly,
-                               layer=foundry.layer_to_gds_label[layer]).to()
+            for layer, polys in self.layer_to_polys.items():
+                if layers is not None and layer not in layers:
+                    continue
+                gds_label = layer_to_gds_label[layer]
+                for poly in polys:
+                    nd.Polygon(points=np.ascontiguousarray(poly.T), layer=gds_label).to()
             for name, port in self.port.items():
                 nd.Pin(name).to(*port.xya)
             nd.put_stub()
@@ -495,11 +566,26 @@ class Device:
             pattern: :code:`Pattern` to add.
             layer: Layer to incorporate :code:`Pattern`.
 
+        Note:
+            If the layer map is already up to date, the new polygons are appended to it directly rather than
+            regrouping every pattern in the device, so building a device with repeated :code:`add` calls is linear.
+
         Returns:
+            This device.
 
         """
+        stale = self._layers_stale()
         self.pattern_to_layer.append((pattern, layer))
-        self.layer_to_polys = self._update_layers()
+        if stale:
+            return self
+        self._layers_count += 1
+        if layer not in self._owned_layers:
+            # copy on write (once per layer), since lists from layer_to_polys may still be held by the caller
+            self._layer_to_polys[layer] = list(self._layer_to_polys[layer])
+            self._owned_layers.add(layer)
+        self._layer_to_polys[layer].extend(pattern.geoms)
+        self._layer_to_pattern = None
+        return self
 
     def plot(self, ax: Optional = None, foundry: Foundry = FABLESS,
              exclude_layer: Optional[List[CommonLayer]] = None, alpha: float = 0.5,
@@ -530,8 +616,7 @@ class Device:
             pattern = Pattern(*multipoly)
             if len(pattern.geoms) > 0:
                 ax.add_patch(
-                    shapely_patch(unary_union(MultiPolygon(pattern.shapely)),
-                                  # union avoids some weird plotting with alpha < 1
+                    shapely_patch(pattern.shapely_union,  # union avoids some weird plotting with alpha < 1
                                   facecolor=color, edgecolor='none', alpha=alpha))
             if plot_ports:
                 for name, port in self.port.items():
@@ -591,9 +676,9 @@ class Device:
             for layer, multipoly in child.full_layer_to_polys.items():
                 if len(multipoly) > 0:
                     polygons = self.child_to_transform[child_name][0].transform_geoms(multipoly)
-                    new_polys = sum([np.split(p, p.shape[0]) if p.ndim == 3 else [p] for p in polygons], [])
-                    new_polys = [np.squeeze(p) for p in new_polys]
-                    layer_to_polys[layer].extend(new_polys)
+                    layer_to_polys[layer].extend(
+                        np.squeeze(q) for p in polygons for q in (np.split(p, p.shape[0]) if p.ndim == 3 else [p])
+                    )
         return layer_to_polys
 
     @property
@@ -642,7 +727,7 @@ class Device:
 
         """
         name = '|'.join([m.name for m in devices]) if name is None else name
-        return cls(name, sum([m.pattern_to_layer for m in devices], []))
+        return cls(name, [pl for m in devices for pl in m.pattern_to_layer])
 
     def smooth_layer(self, distance: float, layer: str):
         """Smooth a layer in the device (useful for sharp corners that may appear)
@@ -658,7 +743,7 @@ class Device:
         for pattern, _layer in self.pattern_to_layer:
             if _layer == layer:
                 pattern.smooth(distance)
-        self.layer_to_polys = self._update_layers()
+        self._layers_dirty = True
         return self
 
     @property
@@ -687,15 +772,18 @@ class Device:
                       for port_layer in foundry.port_layers if self.layer_to_polys[port_layer]}
         overall_bounds = self.bounds
         port_angle_options = (180, -90, 0, 90)
+        layer_to_gds_label = foundry.layer_to_gds_label
+        gds_label_to_layer = foundry.gds_label_to_layer
         # find the port closest to the labels
         for label in labels:
-            layer = foundry.gds_label_to_layer.get(label.layer, CommonLayer.PORT)
+            layer = gds_label_to_layer.get(label.layer, CommonLayer.PORT)
             if foundry.use_port_boxes:
                 bbox = None
                 for port_layer in foundry.port_layers:
-                    if label.layer[0] == foundry.layer_to_gds_label[port_layer][0] and port_layer in port_boxes:
-                        bbox = min(port_boxes[port_layer],
-                                   key=lambda p: np.linalg.norm((p[:2] + p[2:]) / 2 / user_units_per_db_unit - label.xy))
+                    if label.layer[0] == layer_to_gds_label[port_layer][0] and port_layer in port_boxes:
+                        boxes = port_boxes[port_layer]
+                        centers = (boxes[:, :2] + boxes[:, 2:]) / 2 / user_units_per_db_unit
+                        bbox = boxes[np.nanargmin(np.linalg.norm(centers - label.xy, axis=1))]
                 if bbox is not None:
                     side = np.argmin(np.abs(np.array(bbox) - np.array(overall_bounds)))
                     side = side[0] if isinstance(side, np.ndarray) else side
@@ -735,6 +823,7 @@ class Device:
                 struct = klamath.library.try_read_struct(stream)
             cells = {}
             references = {}
+            gds_label_to_layer = foundry.gds_label_to_layer
 
             for key in structs.keys():
                 pattern_to_layer = []
@@ -743,8 +832,8 @@ class Device:
                 references[name] = []
                 for obj in structs[key]:
                     if isinstance(obj, klamath.elements.Boundary):
-                        if obj.layer in foundry.gds_label_to_layer:
-                            layer = foundry.gds_label_to_layer[obj.layer]  # klamath layer is gds_label in dphox
+                        if obj.layer in gds_label_to_layer:
+                            layer = gds_label_to_layer[obj.layer]  # klamath layer is gds_label in dphox
                             poly = obj.xy.T
                             if poly.size > 0:
                                 pattern = Pattern(header.user_units_per_db_unit * poly)
@@ -765,13 +854,15 @@ class Device:
                     cells[node].place(cells[cell_name], ref)
         return cells
 
-    def gds_elements(self, foundry: Foundry = FABLESS, user_units_per_db_unit: float = 0.001):
+    def gds_elements(self, foundry: Foundry = FABLESS, user_units_per_db_unit: float = 0.001,
+                     layers: Optional[List[LayerLabel]] = None):
         """Use `klamath <https://mpxd.net/code/jan/klamath/src/branch/master/klamath>`_ to convert to GDS elements
         using a foundry object and user units.
 
         Args:
             foundry: The foundry used for the layer map.
             user_units_per_db_unit: User units per unit (to convert from nm to um, need to use 0.001 to convert).
+            layers: Only include polygons in these layers (include all layers if :code:`None`).
 
         Returns:
             The `klamath` GDS elements for the device.
@@ -779,16 +870,19 @@ class Device:
         if not KLAMATH_IMPORTED:
             raise ImportError('Klamath not imported, need klamath for GDS export.')
         elements = []
+        layer_to_gds_label = foundry.layer_to_gds_label
         for layer, geom in self.layer_to_polys.items():
+            if layers is not None and layer not in layers:
+                continue
             elements += [
                 klamath.elements.Boundary(
-                    layer=foundry.layer_to_gds_label[layer],
+                    layer=layer_to_gds_label[layer],
                     xy=(poly.T / user_units_per_db_unit).astype(np.int32),
                     properties={}) for poly in geom
             ]
         for name, port in self.port.items():
             elements += [
-                klamath.elements.Text(layer=foundry.layer_to_gds_label.get(port.layer, PORT_GDS_LABEL),
+                klamath.elements.Text(layer=layer_to_gds_label.get(port.layer, PORT_GDS_LABEL),
                                       xy=port.xy / user_units_per_db_unit,
                                       string=name.encode('utf-8'), properties={},
                                       presentation=0, angle_deg=0, invert_y=False, width=0, path_type=0, mag=1),
@@ -877,35 +971,56 @@ class Via(Device):
     name: str = 'via'
 
     def __post_init__(self):
-        self.metal = (self.metal,) if isinstance(self.metal, str) else self.metal
-        self.boundary_grow = self.boundary_grow if isinstance(self.boundary_grow, tuple) \
-            else tuple([self.boundary_grow] * len(self.metal))
-
-        max_boundary_grow = max(self.boundary_grow)
-        via_pattern = Box(self.via_extent, decimals=self.decimals)
-        if self.pitch > 0 and self.shape is not None:
-            patterns = []
-            x, y = np.meshgrid(np.arange(self.shape[0]) * self.pitch, np.arange(self.shape[1]) * self.pitch)
-            for x, y in zip(x.flatten(), y.flatten()):
-                patterns.append(via_pattern.copy.translate(x, y))
-            via_pattern = Pattern(*patterns, decimals=self.decimals)
-        boundary = Box((via_pattern.size[0] + 2 * max_boundary_grow,
-                        via_pattern.size[1] + 2 * max_boundary_grow), decimals=2).align((0, 0)).halign(0)
-        via_pattern.align(boundary)
-        layers = []
-        if isinstance(self.via, list):
-            layers += [(via_pattern.copy, layer) for layer in self.via]
-        elif isinstance(self.via, str):
-            layers += [(via_pattern, self.via)]
-        layers += [(Box((via_pattern.size[0] + 2 * bg,
-                         via_pattern.size[1] + 2 * bg), decimals=2).align(boundary), layer)
-                   for layer, bg in zip(self.metal, self.boundary_grow)]
-        super(Via, self).__init__(self.name, layers)
+        self.metal = (self.metal,) if isinstance(self.metal, str) else tuple(self.metal)
+        self.boundary_grow = (self.boundary_grow,) * len(self.metal) if np.isscalar(self.boundary_grow) \
+            else tuple(self.boundary_grow)
+        via = () if self.via is None else (self.via if isinstance(self.via, str) else tuple(self.via))
+        shape = None if self.shape is None else tuple(self.shape)
+        layers = _via_layers(tuple(self.via_extent), self.boundary_grow, self.metal, via, self.pitch, shape,
+                             self.decimals)
+        super(Via, self).__init__(self.name, deepcopy(layers))
+        minx, miny, maxx, maxy = self.bounds
+        x, y = (minx + maxx) / 2, (miny + maxy) / 2
         self.port = {
-            'w': Port(self.bounds[0], self.center[1], -180),
-            'e': Port(self.bounds[2], self.center[1]),
-            's': Port(self.center[0], self.bounds[1], -90),
-            'n': Port(self.center[0], self.bounds[3], 90),
-            'c': Port(*self.center)
+            'w': Port(minx, y, -180),
+            'e': Port(maxx, y),
+            's': Port(x, miny, -90),
+            'n': Port(x, maxy, 90),
+            'c': Port(x, y)
         }
 
+
+@lru_cache(maxsize=256)
+def _via_layers(via_extent: Float2, boundary_grow: Tuple[float, ...], metal: Tuple[str, ...],
+                via: Union[str, Tuple[str, ...]], pitch: float, shape: Optional[Int2], decimals: int):
+    """Pattern to layer list for a :code:`Via`, cached since the same via is generally instantiated many times.
+
+    Note:
+        The returned patterns are shared by all calls with the same arguments and should be copied before use.
+
+    """
+    max_boundary_grow = max(boundary_grow)
+    via_pattern = Box(via_extent, decimals=decimals)
+    if pitch > 0 and shape is not None:
+        x, y = np.meshgrid(np.arange(shape[0]) * pitch, np.arange(shape[1]) * pitch)
+        # broadcast the via polygon over all via offsets rather than copying and translating one via at a time
+        vias = via_pattern.geoms[0][np.newaxis] + np.column_stack((x.flatten(), y.flatten()))[:, :, np.newaxis]
+        via_pattern = Pattern(vias, decimals=decimals)
+    via_size = np.asarray(via_pattern.size)  # alignment does not change the size, so only compute it once
+    boundary = Box(tuple(via_size + 2 * max_boundary_grow), decimals=2).align((0, 0)).halign(0)
+    boundary_center = boundary.center
+    via_pattern.align(boundary_center)
+    layers = []
+    if isinstance(via, tuple):
+        # each via layer gets its own pattern (so transforms apply once per layer), but the polygon arrays are
+        # shared since transforms replace rather than modify them in place.
+        memo = {id(geom): geom for geom in via_pattern.geoms}
+        layers += [(deepcopy(via_pattern, memo.copy()), layer) for layer in via]
+    elif isinstance(via, str):
+        layers += [(via_pattern, via)]
+    # all metal rectangles (same point order as a shapely box) centered at the boundary center in one broadcast
+    half_extents = (via_size + 2 * np.asarray(boundary_grow)[:, np.newaxis]) / 2
+    metal_boxes = np.asarray(boundary_center)[:, np.newaxis] + half_extents[:, :, np.newaxis] * np.array(
+        ((1, 1, -1, -1, 1), (-1, 1, 1, -1, -1)))
+    layers += [(Pattern(metal_box), layer) for layer, metal_box in zip(metal, metal_boxes)]
+    return layers
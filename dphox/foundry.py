@@ -3,6 +3,7 @@ from enum import Enum
 import numpy as np
 from dataclasses import field, dataclass
 from shapely.geometry import box, MultiPolygon, Polygon
+from shapely.ops import unary_union
 
 from .typing import Dict, Float3, LayerLabel, List, Optional
 from .utils import fix_dataclass_init_docs
@@ -255,14 +256,34 @@ class Foundry:
         except ImportError:
             raise ImportError("Fabrication requires the triangle module to be compiled with trimesh")
         import trimesh
-        from trimesh.creation import extrude_polygon
+        from trimesh.creation import extrude_polygon, extrude_triangulation, triangulate_polygon
         from trimesh.scene import Scene
 
-        def _shapely_to_mesh_from_step(_geom: MultiPolygon, _meshes: List["trimesh.Trimesh"], _step: ProcessStep):
-            for _poly in _geom.geoms:
-                if _poly.area > 1e-8:
-                    _meshes.append(extrude_polygon(_poly, height=_step.thickness))
-            _mesh = trimesh.util.concatenate(_meshes) if len(_meshes) > 0 else trimesh.Trimesh()
+        def _extrude_polygons(_polys: List[Polygon], _height: float):
+            if not _polys:
+                return trimesh.Trimesh()
+            # merge abutting polygons (e.g. the pieces of a polygon with holes) so they share no internal walls,
+            # dropping the collinear points left along the merged edges
+            _union = unary_union(_polys).simplify(0)
+            _polys = [_union] if isinstance(_union, Polygon) else list(_union.geoms)
+            # stack the triangulations of all polygons so that the extrusion is only performed once
+            try:
+                _vertices, _faces, _num_vertices = [], [], 0
+                for _poly in _polys:
+                    _v, _f = triangulate_polygon(_poly)
+                    _vertices.append(_v)
+                    _faces.append(_f + _num_vertices)
+                    _num_vertices += _v.shape[0]
+                _mesh = extrude_triangulation(np.vstack(_vertices), np.vstack(_faces), height=_height)
+                # polygons that still touch at a corner share merged vertices, so extrude those separately
+                if _mesh.is_watertight:
+                    return _mesh
+            except ValueError:
+                pass
+            return trimesh.util.concatenate([extrude_polygon(_poly, height=_height) for _poly in _polys])
+
+        def _shapely_to_mesh_from_step(_geom: MultiPolygon, _step: ProcessStep):
+            _mesh = _extrude_polygons([_poly for _poly in _geom.geoms if _poly.area > 1e-8], _step.thickness)
             _mesh.visual.face_colors = _step.mat.color
             return _mesh
 
@@ -280,7 +301,6 @@ class Foundry:
         for step in self.stack:
             # move the pattern to the previous maximum z height (previous mesh) OR start_height if specified in step.
             dz = step.start_height
-            meshes = []
             layer = step.layer
             if layer in exclude_layer:
                 continue
@@ -289,7 +309,7 @@ class Foundry:
                 geom = layer_to_geom[layer]
                 mesh_name = f"{step.mat.name}_{layer}" if step.mat.name in {SILICON.name, ALUMINUM.name} else layer
                 if step.process_op == ProcessOp.GROW:
-                    mesh = _shapely_to_mesh_from_step(geom, meshes, step)
+                    mesh = _shapely_to_mesh_from_step(geom, step)
                     device.add_geometry(mesh.apply_translation((0, 0, dz)), geom_name=mesh_name)
                 elif step.process_op == ProcessOp.DRI_ETCH:
                     # Directly etch device
@@ -299,13 +319,11 @@ class Foundry:
                     # only support to dope silicon at the moment
                     if prev_mat != SILICON:
                         raise ValueError("The previous material must be crystalline silicon for dopant implantation.")
-                    geoms = []
-                    for poly_si in prev_si_geom.geoms:
-                        for poly in geom:
-                            mat = poly.intersection(poly_si)
-                            if isinstance(mat, Polygon) or isinstance(mat, MultiPolygon):
-                                geoms.append(mat)
-                    mesh = _shapely_to_mesh_from_step(MultiPolygon(geoms), meshes, step)
+                    # a single intersection of the unions rather than intersecting every pair of polygons
+                    doped = unary_union(geom).intersection(unary_union(prev_si_geom))
+                    geoms = [doped] if isinstance(doped, Polygon) else \
+                        [g for g in getattr(doped, 'geoms', []) if isinstance(g, Polygon)]
+                    mesh = _shapely_to_mesh_from_step(MultiPolygon(geoms), step)
                     device.add_geometry(mesh.apply_translation((0, 0, dz - step.thickness)), geom_name=mesh_name)
                 elif step.process_op == ProcessOp.SAC_ETCH:
                     if 'clad' not in device.geometry:
@@ -314,9 +332,7 @@ class Foundry:
                     clad_geometry -= geom
                     clad_geometry = MultiPolygon([clad_geometry]) if isinstance(clad_geometry,
                                                                                 Polygon) else clad_geometry
-                    for poly in clad_geometry:
-                        meshes.append(extrude_polygon(poly, height=step.thickness))
-                    device.geometry['clad'] = trimesh.util.concatenate(meshes)
+                    device.geometry['clad'] = _extrude_polygons(list(clad_geometry.geoms), step.thickness)
                     mesh.visual.face_colors = (*self.cladding.color, 0.5)
                     # raise NotImplementedError(f"Fabrication method not yet implemented for `{step.process_op.value}`")
                     # device.geometry['clad'] -= difference(device.geometry['clad'], mesh)
@@ -1,6 +1,6 @@
 from copy import deepcopy as copy
 
-from .port import Port
+from .port import Port, transform_ports
 from .transform import AffineTransform, rotate2d, translate2d, reflect2d, skew2d, scale2d
 from .typing import Union, Float4, Float2, List, Dict, Optional, Tuple
 
@@ -8,6 +8,8 @@ import numpy as np
 
 
 class Geometry:
+    __slots__ = ('_geoms', 'port', 'refs', 'curve', 'tangents')
+
     def __init__(self, geoms: List[np.ndarray], port: Dict[str, Port], refs: List["Geometry"],
                  tangents: List[np.ndarray] = None):
         self.geoms = geoms
@@ -16,6 +18,14 @@ class Geometry:
         self.curve = None  # reserved for paths.
         self.tangents = [] if tangents is None else tangents
 
+    @property
+    def geoms(self) -> List[np.ndarray]:
+        return self._geoms
+
+    @geoms.setter
+    def geoms(self, geoms: List[np.ndarray]):
+        self._geoms = geoms
+
     @property
     def points(self) -> np.ndarray:
         return np.hstack(self.geoms) if len(self.geoms) > 0 else np.zeros((2, 0))
@@ -80,11 +90,11 @@ class Geometry:
             self.geoms = transformer.transform_geoms(self.geoms)
         if self.tangents:
             self.tangents = transformer.transform_geoms(self.tangents, tangents=True)
-        self.port = {name: port.transform(transform) for name, port in self.port.items()}
+        transform_ports(self.port.values(), transformer.transform)
         for geom in self.refs:
-            geom.transform(transform)
+            geom.transform(transformer)
         if self.curve:
-            self.curve.transform(transform)
+            self.curve.transform(transformer)
         return self
 
     @property
@@ -120,8 +130,8 @@ class Geometry:
 
         """
         self.transform(reflect2d(center, horiz))
-        for name, port in self.port.items():
-            port.a = np.mod(port.a + 180, 360)  # temp fix... need to change how ports are represented
+        for port in self.port.values():
+            port.flip()  # temp fix... need to change how ports are represented (flip keeps xya in sync)
         return self
 
     def rotate(self, angle: float, origin: Union[Float2, np.ndarray] = (0, 0)) -> "Geometry":
@@ -173,10 +183,14 @@ class Geometry:
         port = Port(*port) if isinstance(port, tuple) or isinstance(port, np.ndarray) else port
         from_port = Port(*from_port) if isinstance(from_port, tuple) else from_port
         if from_port is None:
-            return self.rotate(port.a).translate(port.x, port.y)
+            angle, origin, shift = port.a, (0, 0), (port.x, port.y)
         else:
             fp = self.port[from_port] if isinstance(from_port, str) else from_port
-            return self.rotate(port.a - fp.a + 180, origin=fp.xy).translate(port.x - fp.x, port.y - fp.y)
+            angle, origin, shift = port.a - fp.a + 180, fp.xy, (port.x - fp.x, port.y - fp.y)
+        if angle % 360 == 0 and shift[0] == 0 and shift[1] == 0:
+            return self  # already in place, so skip the transform
+        # compose the rotation and translation so the geometry is only transformed once
+        return self.transform(AffineTransform([rotate2d(np.radians(angle), origin), translate2d(shift)]))
 
     def align(self, geom_or_center: Union["Geometry", Float2] = (0, 0),
               other: Union["Geometry", Float2] = None) -> "Geometry":
@@ -22,6 +22,7 @@ class Curve(Geometry):
             or a list of points, or a tuple of points and tangents.
         resolution: Number of evaluations to define :math:`f(t)` (number of points in the curve).
     """
+    __slots__ = ()
 
     def __init__(self, *curves: Union[float, "Curve", CurveLike, List[CurveLike]]):
         points, tangents = get_ndarray_curve(curves)
@@ -339,9 +340,7 @@ def get_ndarray_curve(curvelike_list: Iterable[Union[float, "Curve", CurveLike,
             new_linestrings = np.array(((0, 0), (curve, 0))).T
         elif isinstance(curve, list) or isinstance(curve, tuple):
             # recursively apply to the list.
-            new_linestrings_and_tangents = [get_ndarray_curve([p]) for p in curve]
-            new_linestrings = sum([linestrings for linestrings, _ in new_linestrings_and_tangents], [])
-            new_tangents = sum([tangents for _, tangents in new_linestrings_and_tangents], [])
+            new_linestrings, new_tangents = get_ndarray_curve(curve)
         elif isinstance(curve, Curve):
             new_linestrings = curve.geoms
             new_tangents = curve.tangents
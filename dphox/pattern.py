@@ -2,7 +2,7 @@ import numpy as np
 from dataclasses import dataclass
 
 from shapely.affinity import rotate
-from shapely.geometry import box, GeometryCollection, LineString, LinearRing, Point, JOIN_STYLE, CAP_STYLE
+from shapely.geometry import GeometryCollection, LineString, LinearRing, Point, JOIN_STYLE, CAP_STYLE
 from shapely.ops import split, unary_union, polygonize
 from copy import deepcopy as copy
 
@@ -41,6 +41,7 @@ class Pattern(Geometry):
         polygons: the numpy array representation for the polygons in this pattern.
         decimals: decimal places for rounding (in case of tiny errors in polygons)
     """
+    __slots__ = ('decimals', '_shapely')
 
     def __init__(self, *patterns: Union["Pattern", PolygonLike, List[Union[PolygonLike, "Pattern"]]], decimals: int = 6):
         """Initializer for the pattern class.
@@ -52,13 +53,44 @@ class Pattern(Geometry):
         self.decimals = decimals
         super().__init__(get_ndarray_polygons(patterns), {}, [])
 
+    @property
+    def geoms(self) -> List[np.ndarray]:
+        return self._geoms
+
+    @geoms.setter
+    def geoms(self, geoms: List[np.ndarray]):
+        # polygon arrays are replaced (never modified in place) by transforms, so this invalidates the shapely cache
+        self._geoms = geoms
+        self._shapely = None
+
+    def __getstate__(self):
+        # the shapely cache is rebuilt on demand, so it is not copied along with the pattern
+        slots = {name: getattr(self, name) for cls in type(self).__mro__ for name in cls.__dict__.get('__slots__', ())
+                 if hasattr(self, name)}
+        slots['_shapely'] = None
+        return getattr(self, '__dict__', None), slots
+
     @property
     def shapely(self) -> MultiPolygon:
-        return MultiPolygon([Polygon(np.around(p.T, decimals=self.decimals)) for p in self.geoms])
+        """Shapely multipolygon representation of the pattern.
+
+        Note:
+            The multipolygon is cached until :code:`geoms` is next assigned (e.g. by a transform).
+
+        Returns:
+            The shapely :code:`MultiPolygon` for this pattern.
+
+        """
+        if self._shapely is None:
+            self._shapely = MultiPolygon([Polygon(np.around(p.T, decimals=self.decimals)) for p in self.geoms])
+        return self._shapely
 
     @property
     def shapely_union(self) -> MultiPolygon:
-        pattern = unary_union(self.shapely.geoms)
+        multipolygon = self.shapely
+        if multipolygon.is_empty:
+            return MultiPolygon()
+        pattern = unary_union(multipolygon)
         return pattern if isinstance(pattern, MultiPolygon) else MultiPolygon([pattern])
 
     def mask(self, shape: Shape, spacing: Spacing, smooth_feature: float = 0) -> np.ndarray:
@@ -168,7 +200,7 @@ class Pattern(Geometry):
         """
         import gdspy as gy
         for poly in self.geoms:
-            cell.add(gy.Polygon(poly) if isinstance(poly, Polygon) else cell.add(poly))
+            cell.add(gy.Polygon(np.ascontiguousarray(poly.T)))
 
     @property
     def bbox_pattern(self) -> "Box":
@@ -254,7 +286,7 @@ class Pattern(Geometry):
             raise ImportError('Nazca not installed! Please install nazca prior to running nazca_cell().')
         with nd.Cell(cell_name) as cell:
             for poly in self.geoms:
-                nd.Polygon(points=poly, layer=layer).to()
+                nd.Polygon(points=np.ascontiguousarray(poly.T), layer=layer).to()
             for name, port in self.port.items():
                 nd.Pin(name).to(*port.xya)
             nd.put_stub()
@@ -343,7 +375,7 @@ def get_ndarray_polygons(polylike_list: Iterable[Union["Pattern", PolygonLike, L
 
     Args:
         polylike_list: List of polygon-like objects including :code:`Pattern`, shapely geometry collections,
-            GDSPY geometries, and more.
+            GDSPY geometries, :math:`M \\times 2 \\times N` stacks of polygons, and more.
         decimals: decimal precision of the resulting polygons
 
     Returns:
@@ -354,26 +386,30 @@ def get_ndarray_polygons(polylike_list: Iterable[Union["Pattern", PolygonLike, L
     for pattern in polylike_list:
         if isinstance(pattern, list):
             # recursively apply to the list.
-            polygons.extend(sum([get_ndarray_polygons([p]) for p in pattern], []))
+            polygons.extend(get_ndarray_polygons(pattern, decimals))
         elif isinstance(pattern, Pattern):
-            polygons.extend(pattern.geoms)
+            polygons.extend(np.around(p, decimals=decimals) for p in pattern.geoms)
         elif isinstance(pattern, np.ndarray):
-            polygons.append(pattern)
+            # a 3d array is a stack of polygons with the same number of points, which is rounded in one call.
+            polygons.extend(np.around(pattern, decimals=decimals) if pattern.ndim == 3
+                            else [np.around(pattern, decimals=decimals)])
         elif isinstance(pattern, Polygon):
             pattern = split_holes(pattern)
-            polygons.extend([poly_points(geom).T for geom in pattern.geoms])
+            polygons.extend([np.around(poly_points(geom).T, decimals=decimals) for geom in pattern.geoms])
         elif isinstance(pattern, MultiPolygon):
-            polygons.extend([poly_points(geom).T for geom in split_holes(pattern).geoms])
+            polygons.extend([np.around(poly_points(geom).T, decimals=decimals)
+                             for geom in split_holes(pattern).geoms])
         elif isinstance(pattern, GeometryCollection):
-            polygons.extend([poly_points(geom).T for geom in split_holes(pattern).geoms])
+            polygons.extend([np.around(poly_points(geom).T, decimals=decimals)
+                             for geom in split_holes(pattern).geoms])
         elif GDSPY_IMPORTED:
             if isinstance(pattern, gy.FlexPath):
-                polygons.extend(pattern.get_polygons())
+                polygons.extend(np.around(p, decimals=decimals) for p in pattern.get_polygons())
             elif isinstance(pattern, gy.Path):
-                polygons.extend(pattern.polygons)
+                polygons.extend(np.around(p, decimals=decimals) for p in pattern.polygons)
         else:
             raise TypeError(f'Pattern does not accept type {type(pattern)}')
-    return [np.around(p, decimals=decimals) for p in polygons]
+    return polygons
 
 
 @fix_dataclass_init_docs
@@ -390,15 +426,18 @@ class Box(Pattern):
     decimals: int = 6
 
     def __post_init__(self):
-        super(Box, self).__init__(box(-self.extent[0] / 2, -self.extent[1] / 2,
-                                      self.extent[0] / 2, self.extent[1] / 2),
+        # build the rectangle directly (same point order as a shapely box) rather than converting from shapely
+        hx, hy = self.extent[0] / 2, self.extent[1] / 2
+        super(Box, self).__init__(np.array(((hx, hx, -hx, -hx, hx), (-hy, hy, hy, -hy, -hy)), dtype=np.float64),
                                   decimals=self.decimals)
+        minx, miny, maxx, maxy = self.bounds
+        x, y = (minx + maxx) / 2, (miny + maxy) / 2
         self.port = {
-            'c': Port(*self.center),
-            'n': Port(self.center[0], self.bounds[3], 90, self.extent[0]),
-            'w': Port(self.bounds[0], self.center[1], -180, self.extent[1]),
-            'e': Port(self.bounds[2], self.center[1], 0, self.extent[1]),
-            's': Port(self.center[0], self.bounds[1], -90, self.extent[0])
+            'c': Port(x, y),
+            'n': Port(x, maxy, 90, self.extent[0]),
+            'w': Port(minx, y, -180, self.extent[1]),
+            'e': Port(maxx, y, 0, self.extent[1]),
+            's': Port(x, miny, -90, self.extent[0])
         }
 
     def expand(self, grow: float) -> "Box":
@@ -424,9 +463,10 @@ class Box(Pattern):
             A box of specified :code:`thickness` with no filling inside.
 
         """
+        outer = self.shapely_union  # reused for both differences
         return Pattern(
-            self.difference(Box((self.extent[0] - 2 * thickness, self.extent[1])).align(self)),
-            self.difference(Box((self.extent[0], self.extent[1] - 2 * thickness)).align(self)),
+            outer.difference(Box((self.extent[0] - 2 * thickness, self.extent[1])).align(self).shapely_union),
+            outer.difference(Box((self.extent[0], self.extent[1] - 2 * thickness)).align(self).shapely_union),
         )
 
     def cup(self, thickness: float) -> Pattern:
@@ -439,9 +479,10 @@ class Box(Pattern):
             A cup-shaped block of thickness :code:`thickness`.
 
         """
+        outer = self.shapely_union  # reused for both differences
         return Pattern(
-            self.difference(Box((self.extent[0] - 2 * thickness, self.extent[1])).align(self)),
-            self.difference(Box((self.extent[0], self.extent[1] - thickness)).align(self).valign(self)),
+            outer.difference(Box((self.extent[0] - 2 * thickness, self.extent[1])).align(self).shapely_union),
+            outer.difference(Box((self.extent[0], self.extent[1] - thickness)).align(self).valign(self).shapely_union),
         )
 
     def ell(self, thickness: float) -> Pattern:
@@ -454,9 +495,10 @@ class Box(Pattern):
             An L-shaped block of thickness :code:`thickness`.
 
         """
+        outer = self.shapely_union  # reused for both differences
         return Pattern(
-            self.difference(Box((self.extent[0] - thickness, self.extent[1])).align(self).halign(self)),
-            self.difference(Box((self.extent[0], self.extent[1] - thickness)).align(self).valign(self)),
+            outer.difference(Box((self.extent[0] - thickness, self.extent[1])).align(self).halign(self).shapely_union),
+            outer.difference(Box((self.extent[0], self.extent[1] - thickness)).align(self).valign(self).shapely_union),
         )
 
     def striped(self, stripe_w: float, pitch: Optional[Float2] = None,
@@ -477,16 +519,17 @@ class Box(Pattern):
         patterns = []
         if include_boundary:
             patterns = [self.hollow(stripe_w)] if pitch[0] > 0 and pitch[1] > 0 else []
-        if pitch[0] > 0 and not 3 * pitch[1] >= self.size[0] and along_x:
-            xs = np.mgrid[self.bounds[0] + pitch[0]:self.bounds[2]:pitch[0]]
-            patterns.append(
-                Pattern(*[Box(extent=(stripe_w, self.size[1])).halign(x) for x in xs]).align(
-                    self.center))
-        if pitch[1] > 0 and not 3 * pitch[1] >= self.size[1] and along_y:
-            ys = np.mgrid[self.bounds[1] + pitch[1]:self.bounds[3]:pitch[1]]
-            patterns.append(
-                Pattern(*[Box(extent=(self.size[0], stripe_w)).valign(y) for y in ys]).align(
-                    self.center))
+        minx, miny, maxx, maxy = self.bounds
+        center, size = ((minx + maxx) / 2, (miny + maxy) / 2), (maxx - minx, maxy - miny)
+        # each set of stripes is a single stripe broadcast over the stripe offsets (left / bottom edge at x / y)
+        if pitch[0] > 0 and not 3 * pitch[1] >= size[0] and along_x:
+            xs = np.mgrid[minx + pitch[0]:maxx:pitch[0]] + stripe_w / 2
+            stripes = Box(extent=(stripe_w, size[1])).geoms[0] + np.stack((xs, np.zeros_like(xs)), axis=1)[..., None]
+            patterns.append(Pattern(stripes).align(center))
+        if pitch[1] > 0 and not 3 * pitch[1] >= size[1] and along_y:
+            ys = np.mgrid[miny + pitch[1]:maxy:pitch[1]] + stripe_w / 2
+            stripes = Box(extent=(size[0], stripe_w)).geoms[0] + np.stack((np.zeros_like(ys), ys), axis=1)[..., None]
+            patterns.append(Pattern(stripes).align(center))
         return Pattern(*patterns)
 
     def flexure(self, spring_extent: Float2, connector_extent: Float2 = None,
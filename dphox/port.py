@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Iterable, Tuple
 
 import numpy as np
 
@@ -135,22 +135,14 @@ class Port:
         """Transform.
 
         Args:
-            transform: affine transform tensor whose final two dimensions transform the port
+            transform: :code:`3x3` affine transform.
             decimals: decimal precision for port x, y after the rotation.
 
         Returns:
+            The transformed port.
 
         """
-        line = self.transformed_line(transform).T
-        c = (line[0] + line[1]) / 2
-        d = (line[1, 1] - line[0, 1]) + (line[1, 0] - line[0, 0]) * 1j
-        self.a = -np.angle(d) * 180 / np.pi
-        self.x = np.around(c[0], decimals)
-        self.y = np.around(c[1], decimals)
-        self.w = np.abs(d)
-        self.xy = np.array((self.x, self.y))
-        self.xya = np.array((self.x, self.y, self.a))
-        self.center = np.array((self.x, self.y, self.z))
+        transform_ports([self], transform, decimals)
         return self
 
     def hvplot(self, name: str = 'port'):
@@ -161,6 +153,15 @@ class Port:
         return hv.Polygons([{'x': x, 'y': y}]).opts(
             data_aspect=1, frame_height=200, color='red', line_alpha=0) * hv.Text(px[0], py[0], name)
 
+    def _set_xya(self, x: float, y: float, a: float, decimals: float = DECIMALS) -> "Port":
+        """Set the position (rounded to :code:`decimals`) and angle (wrapped to :math:`[-180, 180)`) of the port."""
+        self.x, self.y = np.around(np.array((x, y), dtype=np.float64), decimals)
+        self.a = np.mod(np.float64(a) + 180, 360) - 180
+        self.xy = np.array((self.x, self.y))
+        self.xya = np.array((self.x, self.y, self.a))
+        self.center = np.array((self.x, self.y, self.z))
+        return self
+
     def translate(self, dx: float = 0, dy: float = 0) -> "Port":
         """Translate port.
 
@@ -172,7 +173,7 @@ class Port:
             The translated port
 
         """
-        return self.transform(translate2d((dx, dy)))
+        return self._set_xya(self.x + dx, self.y + dy, self.a)
 
     def rotate(self, angle: float, origin: Tuple[float, float] = (0, 0)) -> "Port":
         """Rotate the geometry about :code:`origin`.
@@ -185,7 +186,9 @@ class Port:
             The rotated port
 
         """
-        return self.transform(rotate2d(np.radians(angle), origin))
+        c, s = np.cos(np.radians(angle)), np.sin(np.radians(angle))
+        x, y = self.x - origin[0], self.y - origin[1]
+        return self._set_xya(c * x - s * y + origin[0], s * x + c * y + origin[1], self.a + angle)
 
     @property
     def copy(self) -> "Port":
@@ -234,3 +237,44 @@ class Port:
         """
         x, y, a, f = xyaf
         return self.transform(translate2d((x, y)) @ rotate2d(np.radians(a)) @ reflect2d(flip=bool(f)))
+
+
+def transform_ports(ports: Iterable[Port], transform: np.ndarray, decimals: float = DECIMALS):
+    """Transform many ports in place using a single matrix multiply over all of the port lines.
+
+    Args:
+        ports: The ports to transform.
+        transform: :code:`3x3` affine transform.
+        decimals: decimal precision for port x, y after the transform.
+
+    Returns:
+        The transformed ports (each port is transformed once, even if it is passed more than once).
+
+    """
+    transform = np.asarray(transform)
+    if transform.shape != (3, 3):
+        raise ValueError(f'Expected a single 3x3 affine transform for the ports but got shape {transform.shape}.')
+    ports = list({id(port): port for port in ports}.values())
+    if not ports:
+        return ports
+    x, y, a, w = np.array([(port.x, port.y, port.a, port.w) for port in ports], dtype=np.float64).T
+    dx, dy = -np.sin(np.radians(a)) * w / 2, np.cos(np.radians(a)) * w / 2
+    # the line endpoints of every port are interleaved as columns of a single 3 x 2N homogeneous array
+    lines = np.vstack((np.column_stack((x - dx, x + dx)).ravel(),
+                       np.column_stack((y - dy, y + dy)).ravel(),
+                       np.ones(2 * len(ports))))
+    lines = transform[:2, :] @ lines
+    start, end = lines[:, ::2], lines[:, 1::2]
+    c = np.around((start + end) / 2, decimals)
+    d = (end[1] - start[1]) + (end[0] - start[0]) * 1j
+    angles = -np.angle(d) * 180 / np.pi
+    widths = np.abs(d)
+    for i, port in enumerate(ports):
+        port.a = angles[i]
+        port.x = c[0, i]
+        port.y = c[1, i]
+        port.w = widths[i]
+        port.xy = np.array((port.x, port.y))
+        port.xya = np.array((port.x, port.y, port.a))
+        port.center = np.array((port.x, port.y, port.z))
+    return ports
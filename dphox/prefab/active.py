@@ -299,6 +299,7 @@ class MultilayerPath(Device):
 
     def __post_init__(self):
         waveguided_patterns = []
+        pattern_to_layer = []
         if not self.sequence or np.isscalar(self.sequence[0]):
             port = self.start_port
         else:
@@ -315,10 +316,11 @@ class MultilayerPath(Device):
                     port = d.dummy_port_pattern.to(port, 'a0').port['b0'].copy
                 else:
                     waveguided_patterns.append(d.to(port, 'a0'))
+                    if isinstance(d, Pattern):
+                        pattern_to_layer.append((d, self.path_layer))
+                    else:
+                        pattern_to_layer.extend(d.pattern_to_layer)
                     port = d.port['b0'].copy
-        pattern_to_layer = sum(
-            [[(p, self.path_layer)] if isinstance(p, Pattern) else [p] for p in waveguided_patterns],
-            [])
         super(MultilayerPath, self).__init__(self.name, pattern_to_layer)
         for child in child_to_device:
             self.place(child_to_device[child], child_to_ports[child], 'a0')
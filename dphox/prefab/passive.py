@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple
 
 import numpy as np
@@ -124,9 +125,16 @@ class Array(Pattern):
     def __post_init__(self):
         self.pitch = np.array(self.unit.size) * 2 if self.pitch is None else self.pitch
         self.pitch = (self.pitch, self.pitch) if np.isscalar(self.pitch) else self.pitch
-        super().__init__([self.unit.copy.translate(i * self.pitch[0], j * self.pitch[1])
-                          for i in range(self.grid_shape[0]) for j in range(self.grid_shape[1])
-                         ])
+        x, y = np.meshgrid(np.arange(self.grid_shape[0]) * self.pitch[0],
+                           np.arange(self.grid_shape[1]) * self.pitch[1], indexing='ij')
+        offsets = np.column_stack((x.flatten(), y.flatten()))[:, :, np.newaxis]
+        # broadcast each unit polygon over all array offsets rather than copying and translating the unit per cell,
+        # keeping the polygons ordered by array cell (then by unit polygon).
+        stacks = [geom[np.newaxis] + offsets for geom in self.unit.geoms]
+        if len({geom.shape for geom in self.unit.geoms}) == 1:
+            super().__init__(np.stack(stacks, axis=1).reshape((-1,) + self.unit.geoms[0].shape))
+        else:
+            super().__init__([stack[k] for k in range(offsets.shape[0]) for stack in stacks])
 
 
 @fix_dataclass_init_docs
@@ -215,11 +223,24 @@ class StraightGrating(Device):
     def __post_init__(self):
         self.stripe_w = self.pitch * (1 - self.duty_cycle)
         slab = (Box(self.extent).hstack(self.waveguide).buffer(self.rib_grow), self.slab)
-        grating = (Box(self.extent).hstack(self.waveguide).striped(self.stripe_w, (self.pitch, 0)), self.ridge)
+        grating_box = Box(self.extent).hstack(self.waveguide)
+        grating = (_grating_stripes(tuple(self.extent), self.stripe_w, self.pitch).copy.translate(*grating_box.center),
+                   self.ridge)
         super().__init__(self.name, [slab, grating, (self.waveguide, self.ridge)])
         self.port['a0'] = self.waveguide.port['a0'].copy
 
 
+@lru_cache(maxsize=256)
+def _grating_stripes(extent: Float2, stripe_w: float, pitch: float) -> Pattern:
+    """Striped grating box centered at the origin, cached since the same grating is generally reused many times.
+
+    Note:
+        The returned pattern is shared by all calls with the same arguments and should be copied before use.
+
+    """
+    return Box(extent).striped(stripe_w, (pitch, 0))
+
+
 @fix_dataclass_init_docs
 @dataclass
 class FocusingGrating(Device):
@@ -170,7 +170,7 @@ def _parse_gds_transform(transform):
             if len(transform) <= 5 and all([np.isscalar(v) for v in transform]):
                 gds_transforms = [GDSTransform(*transform)]
             else:
-                gds_transforms = sum([_parse_gds_transform(t) for t in transform], [])
+                gds_transforms = [gds_t for t in transform for gds_t in _parse_gds_transform(t)]
         else:
             raise TypeError("Expected transform to be of type GDSTransform, or tuple or ndarray representing GDS"
                             f"transforms, but got a malformed input of type: {type(transform)}")
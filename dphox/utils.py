@@ -28,7 +28,7 @@ def poly_points(geom: Polygon, decimals: Optional[int] = None):
     coords = geom.exterior.coords
     if len(coords) == 0:
         raise ValueError('There are no coordinates in this geometry.')
-    points = np.array(coords.xy).T
+    points = np.asarray(coords)[:, :2]
     return points if decimals is None else np.around(points, decimals)
 
 
@@ -46,7 +46,7 @@ def linestring_points(geom: LineString, decimals: Optional[int] = None):
     coords = geom.coords
     if len(coords) == 0:
         raise ValueError('There are no coordinates in this geometry.')
-    points = np.array(coords.xy).T
+    points = np.asarray(coords)[:, :2]
     return points if decimals is None else np.around(points, decimals)
 
 
@@ -159,11 +159,24 @@ def poly_bounds(polygons: List[np.ndarray], overall: bool = False):
         overall: Get the overall bounds rather than a list of bounds for each polygon
 
     Returns:
-        Bounding box tuple.
+        Bounding box tuple (or a :math:`M \\times 4` array of bounding boxes for :math:`M` polygons,
+        with :code:`nan` rows for any polygons without points).
 
     """
-
-    return bounds(np.hstack(polygons)) if overall else [bounds(p) for p in polygons]
+    if overall:
+        return bounds(np.hstack(polygons))
+    sizes = np.array([p.shape[1] for p in polygons], dtype=int)
+    boxes = np.full((len(polygons), 4), np.nan)
+    nonempty = sizes > 0
+    if np.any(nonempty):
+        # reduce over the contiguous point ranges of each polygon rather than looping over the polygons
+        points = np.hstack(polygons)
+        starts = np.cumsum(sizes[nonempty]) - sizes[nonempty]
+        boxes[nonempty] = np.column_stack((np.minimum.reduceat(points[0], starts),
+                                           np.minimum.reduceat(points[1], starts),
+                                           np.maximum.reduceat(points[0], starts),
+                                           np.maximum.reduceat(points[1], starts)))
+    return boxes
 
 
 def min_aspect_bounds(b: Union[np.ndarray, Float4], min_aspect: float = 0.25):
@@ -212,10 +225,10 @@ def shapely_patch(geom: Union[MultiPolygon, Polygon], **kwargs):
 
     vertices = np.vstack([np.vstack([np.array(poly.exterior)[:, :2]] + [np.array(hole)[:, :2] for hole in poly.interiors])
                           for poly in polygon]).squeeze()
-    codes = sum([
-        [Path.MOVETO] + [Path.LINETO] * (len(poly.exterior.coords) - 1) +
-        sum([[Path.MOVETO] + [Path.LINETO] * (len(hole.coords) - 1) for hole in poly.interiors], [])
-        for poly in polygon], [])
+    codes = []
+    for poly in polygon:
+        for ring in [poly.exterior] + list(poly.interiors):
+            codes.extend([Path.MOVETO] + [Path.LINETO] * (len(ring.coords) - 1))
 
     return PathPatch(Path(vertices, codes), **kwargs)
 
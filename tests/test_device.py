@@ -0,0 +1,205 @@
+import numpy as np
+import pytest
+from typing import List, Tuple
+from shapely.geometry import Polygon
+
+from dphox.device import Device, Via
+from dphox.path import straight
+from dphox.pattern import Box, Pattern, Port
+from dphox.prefab.passive import StraightGrating
+
+BOX_DEVICE_LAYERS = [(Box((2, 1)), 'ridge_si'), (Box((1, 1)), 'metal_1')]
+
+
+@pytest.mark.parametrize(
+    "dx, dy, angle",
+    [
+        [1, 2, 0],
+        [-3, 0.5, 90],
+        [0, 0, 45],
+    ],
+)
+def test_layer_to_polys_after_transform(dx: float, dy: float, angle: float):
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    device.translate(dx, dy).rotate(angle)
+    for pattern, layer in device.pattern_to_layer:
+        np.testing.assert_allclose(device.layer_to_polys[layer][0], pattern.geoms[0])
+
+
+@pytest.mark.parametrize(
+    "port, expected_xya",
+    [
+        [Port(3, 4, 90), (3, 4, 90)],
+        [Port(-1, 2, 0), (-1, 2, 0)],
+        [Port(0, 0, 180), (0, 0, 180)],
+    ],
+)
+def test_to_with_shared_pattern_ports(port: Port, expected_xya: Tuple[float, float, float]):
+    pattern = Box((2, 1))
+    pattern.port = {'a0': Port(-1, 0, 180), 'b0': Port(1, 0, 0)}
+    device = Device.from_pattern(pattern, 'device', 'ridge_si').to(port, 'a0')
+    b0 = device.port['b0']
+    a = np.radians(expected_xya[2])
+    np.testing.assert_allclose((b0.x, b0.y), (expected_xya[0] + 2 * np.cos(a), expected_xya[1] + 2 * np.sin(a)),
+                               atol=1e-6)
+    np.testing.assert_allclose(np.mod(b0.a - expected_xya[2], 360), 0, atol=1e-6)
+
+
+def test_translate_aliased_device_port():
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    port = Port(1, 0, 0)
+    device.port = {'a0': port, 'b0': port}
+    device.translate(2, 0)
+    np.testing.assert_allclose(port.xya, (3, 0, 0))
+
+
+def test_copy_shares_children():
+    child = Device('child', [(Box((1, 1)), 'ridge_si')])
+    device = Device('device', [(Box((2, 1)), 'ridge_si')])
+    device.place(child, Port(1, 0, 0))
+    device_copy = device.copy
+    device_copy.add(Box((1, 1)), 'metal_1')
+    assert device_copy.child_to_device['child'] is child
+    assert device_copy.pattern_to_layer[0][0] is not device.pattern_to_layer[0][0]
+    assert len(device.pattern_to_layer) == 1 and len(device_copy.pattern_to_layer) == 2
+
+
+def test_bounds_after_transform():
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    np.testing.assert_allclose(device.bounds, (-1, -0.5, 1, 0.5))
+    device.translate(1, 2)
+    np.testing.assert_allclose(device.bounds, (0, 1.5, 2, 2.5))
+    device.add(Box((4, 1)), 'metal_2')
+    np.testing.assert_allclose(device.bounds, (-2, -0.5, 2, 2.5))
+
+
+def test_bounds_after_shared_pattern_transform():
+    pattern = Box((2, 1))
+    device = Device('device', [(pattern, 'ridge_si')])
+    np.testing.assert_allclose(device.bounds, (-1, -0.5, 1, 0.5))
+    pattern.translate(3, 0)
+    np.testing.assert_allclose(device.bounds, (2, -0.5, 4, 0.5))
+
+
+def test_gds_elements_layers():
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    assert len(device.gds_elements()) == 2
+    assert len(device.gds_elements(layers=['metal_1'])) == 1
+
+
+@pytest.mark.parametrize(
+    "shape, pitch",
+    [
+        [(3, 2), 1],
+        [(1, 4), 0.5],
+    ],
+)
+def test_via_array(shape: Tuple[int, int], pitch: float):
+    via = Via((0.4, 0.4), 0.1, pitch=pitch, shape=shape)
+    via_pattern = via.pattern_to_layer[0][0]
+    assert via_pattern.num_geoms == shape[0] * shape[1]
+    np.testing.assert_allclose(via_pattern.size, ((shape[0] - 1) * pitch + 0.4, (shape[1] - 1) * pitch + 0.4))
+
+
+def test_via_instances_are_independent():
+    via = Via((0.4, 0.4), 0.1, pitch=1, shape=(2, 2)).translate(5, 0)
+    other = Via((0.4, 0.4), 0.1, pitch=1, shape=(2, 2))
+    np.testing.assert_allclose(via.bounds, other.bounds + np.array((5, 0, 5, 0)))
+
+
+@pytest.mark.parametrize(
+    "extent, pitch, duty_cycle",
+    [
+        [(4, 3), 0.6, 0.5],
+        [(5, 2), 0.8, 0.3],
+    ],
+)
+def test_straight_grating_instances_are_independent(extent: Tuple[float, float], pitch: float, duty_cycle: float):
+    grating = StraightGrating(extent, straight(5).path(0.5), pitch, duty_cycle).translate(3, 0)
+    other = StraightGrating(extent, straight(5).path(0.5), pitch, duty_cycle)
+    expected = Box(extent).hstack(straight(5).path(0.5)).striped(pitch * (1 - duty_cycle), (pitch, 0))
+    np.testing.assert_allclose(grating.bounds, other.bounds + np.array((3, 0, 3, 0)))
+    np.testing.assert_allclose(np.stack(other.pattern_to_layer[1][0].geoms), np.stack(expected.geoms))
+
+
+def test_cached_geometry_mutation():
+    via = Via((0.4, 0.4), 0.1, pitch=1, shape=(2, 2))
+    grating = StraightGrating((4, 3), straight(5).path(0.5), 0.6)
+    for pattern, _ in via.pattern_to_layer + grating.pattern_to_layer:
+        pattern.geoms[0][:] += 10
+        pattern.geoms.append(Box((1, 1)).geoms[0])
+    np.testing.assert_allclose(Via((0.4, 0.4), 0.1, pitch=1, shape=(2, 2)).bounds, (0, -0.8, 1.6, 0.8))
+    np.testing.assert_allclose(StraightGrating((4, 3), straight(5).path(0.5), 0.6).bounds, (-4, -1.5, 5, 1.5))
+
+
+def test_via_list_boundary_grow():
+    via = Via((0.4, 0.4), [0.1, 0.3], metal=['metal_1', 'metal_2'])
+    np.testing.assert_allclose(via.bounds, Via((0.4, 0.4), (0.1, 0.3), metal=('metal_1', 'metal_2')).bounds)
+
+
+def test_via_without_via_layers():
+    via = Via((0.4, 0.4), 0.1, via=None)
+    assert [layer for _, layer in via.pattern_to_layer] == list(via.metal)
+
+
+def test_add_after_layer_access():
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    assert len(device.layer_to_polys['metal_1']) == 1
+    device.add(Box((1, 1)).translate(2), 'metal_1').add(Box((1, 1)), 'metal_2')
+    assert len(device.layer_to_polys['metal_1']) == 2
+    assert len(device.layer_to_polys['metal_2']) == 1
+    np.testing.assert_allclose(device.bounds, (-1, -0.5, 2.5, 0.5))
+
+
+def test_pattern_to_layer_append():
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    assert len(device.layer_to_polys['metal_1']) == 1
+    device.pattern_to_layer.append((Box((1, 1)).translate(2), 'metal_1'))
+    assert len(device.layer_to_polys['metal_1']) == 2
+    device.translate(1, 0)
+    np.testing.assert_allclose(device.bounds, (0, -0.5, 3.5, 0.5))
+
+
+def test_add_keeps_held_layer_polys():
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    metal_polys = device.layer_to_polys['metal_1']
+    device.add(Box((1, 1)).translate(2), 'metal_1').add(Box((1, 1)).translate(4), 'metal_1')
+    assert len(metal_polys) == 1
+    assert len(device.layer_to_polys['metal_1']) == 3
+
+
+def test_layer_to_pattern_after_transform():
+    device = Device('device', [(p.copy, layer) for p, layer in BOX_DEVICE_LAYERS])
+    device.layer_to_pattern['ridge_si'].translate(5, 0)
+    np.testing.assert_allclose(device.layer_to_pattern['ridge_si'].bounds, (-1, -0.5, 1, 0.5))
+    device.translate(1, 0)
+    np.testing.assert_allclose(device.layer_to_pattern['ridge_si'].bounds, (0, -0.5, 2, 0.5))
+
+
+def test_trimesh_matches_polygon_extrusion():
+    pytest.importorskip('triangle')
+    trimesh = pytest.importorskip('trimesh')
+    via = Via((0.4, 0.4), 0.1, pitch=1, shape=(3, 2))
+    scene = via.trimesh()
+    for layer, polys in via.layer_to_polys.items():
+        mesh = scene.geometry[layer]
+        expected = [trimesh.creation.extrude_polygon(Polygon(p.T), height=mesh.extents[2]) for p in polys]
+        assert mesh.is_watertight
+        np.testing.assert_allclose(mesh.volume, sum(m.volume for m in expected))
+
+
+@pytest.mark.parametrize(
+    "patterns, volume",
+    [
+        [[Box((1, 1)), Box((1, 1)).translate(1)], 2],
+        [[Box((1, 1)), Box((1, 1)).translate(1, 1)], 2],
+        [[Box((4, 4)).hollow(1)], 12],
+    ],
+)
+def test_trimesh_abutting_polygons(patterns: List[Pattern], volume: float):
+    pytest.importorskip('triangle')
+    pytest.importorskip('trimesh')
+    device = Device('device', [(pattern, 'metal_1') for pattern in patterns])
+    mesh = device.trimesh().geometry['metal_1']
+    assert mesh.is_watertight
+    np.testing.assert_allclose(mesh.volume, volume * mesh.extents[2])
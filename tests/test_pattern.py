@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Tuple, Union
 
 import numpy as np
 import pytest
 
 from dphox.pattern import Box, Circle, Pattern
+from dphox.prefab.passive import Array
 from dphox.utils import poly_points, split_holes
 
 UNIT_BOX = Box()
@@ -63,3 +64,46 @@ def test_poly(pattern: Pattern, poly_list: List[np.ndarray]):
 def test_poly_with_hole(pattern: Pattern, poly_list: List[np.ndarray]):
     for i, poly in enumerate(split_holes(pattern.shapely_union)):
         np.testing.assert_allclose(poly_points(poly).T, poly_list[i], atol=1e-5)
+
+
+def test_shapely_after_transform():
+    pattern = Box((2, 1))
+    np.testing.assert_allclose(pattern.shapely.bounds, (-1, -0.5, 1, 0.5))
+    assert pattern.shapely is pattern.shapely
+    pattern.translate(1, 2)
+    np.testing.assert_allclose(pattern.shapely.bounds, (0, 1.5, 2, 2.5))
+
+
+def test_shapely_after_copy():
+    pattern = Box((2, 1))
+    shapely = pattern.shapely
+    copied = pattern.copy.translate(1, 2)
+    np.testing.assert_allclose(copied.shapely.bounds, (0, 1.5, 2, 2.5))
+    assert pattern.shapely is shapely
+
+
+def test_pattern_from_polygon_stack():
+    offsets = np.array([[0, 0], [2, 0], [0, 3]])
+    stack = UNIT_BOX.geoms[0][np.newaxis] + offsets[:, :, np.newaxis] + 1e-9
+    pattern = Pattern(stack)
+    assert pattern.num_geoms == 3
+    for geom, offset in zip(pattern.geoms, offsets):
+        np.testing.assert_array_equal(geom, UNIT_BOX.geoms[0] + offset[:, np.newaxis])
+
+
+@pytest.mark.parametrize(
+    "unit, grid_shape, pitch",
+    [
+        [Circle(0.2), (3, 4), 1],
+        [Pattern(Box((0.2, 0.3)), Box((0.1, 0.1)).translate(0.5)), (3, 2), (1, 2)],
+        [Pattern(Box((0.2, 0.3)), Circle(0.1).translate(0.5)), (2, 2), (1, 1)],
+    ],
+)
+def test_array_polygon_order(unit: Pattern, grid_shape: Tuple[int, int], pitch: Union[float, Tuple[float, float]]):
+    pitches = (pitch, pitch) if np.isscalar(pitch) else pitch
+    expected = Pattern([unit.copy.translate(i * pitches[0], j * pitches[1])
+                        for i in range(grid_shape[0]) for j in range(grid_shape[1])])
+    geoms = Array(unit, grid_shape, pitch).geoms
+    assert len(geoms) == len(expected.geoms)
+    for geom, expected_geom in zip(geoms, expected.geoms):
+        np.testing.assert_allclose(geom, expected_geom)
@@ -3,6 +3,8 @@ import pytest
 from typing import Optional, Tuple
 
 from dphox.pattern import Pattern, Box
+from dphox.port import Port, transform_ports
+from dphox.transform import translate2d
 
 BOX = Box((1, 1))
 
@@ -54,3 +56,29 @@ def test_scale(pattern: Pattern, xfact: int, yfact: int, origin: Optional[Tuple[
                expected_polygon: np.ndarray):
     np.testing.assert_allclose(np.asarray(pattern.copy.scale(xfact, yfact, origin=origin).geoms[0]),
                                expected_polygon, rtol=3e-5)
+
+
+@pytest.mark.parametrize(
+    "port, angle, origin, expected_xya",
+    [
+        [Port(1, 0, 0), 90, (0, 0), (0, 1, 90)],
+        [Port(1, 0, 90), 180, (0, 0), (-1, 0, -90)],
+        [Port(2, 1, 180), -90, (1, 1), (1, 0, 90)],
+        [Port(0, 0, -90), 270, (1, 0), (1, 1, -180)],
+    ],
+)
+def test_port_rotate(port: Port, angle: float, origin: Tuple[float, float], expected_xya: Tuple[float, float, float]):
+    np.testing.assert_allclose(port.rotate(angle, origin).xya, expected_xya, atol=1e-6)
+
+
+def test_port_xya_after_reflect():
+    port = Box((2, 1)).reflect(horiz=True).port['e']
+    np.testing.assert_allclose(port.xya, (port.x, port.y, port.a))
+
+
+def test_transform_ports_once_per_port():
+    port = Port(1, 2, 0)
+    transform_ports([port, port], translate2d((1, 0)))
+    np.testing.assert_allclose(port.xya, (2, 2, 0))
+    with pytest.raises(ValueError):
+        transform_ports([port], np.stack((translate2d((1, 0)), translate2d((2, 0)))))